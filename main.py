@@ -1,27 +1,95 @@
+"""Vizio TV API.
+
+Concurrency note: pyvizio issues blocking HTTP to the TV, so the workload
+is I/O-bound — offload with threads, never processes. A ProcessPoolExecutor
+would add ~20 MB RSS per worker for zero benefit here (the GIL is released
+during network I/O), which matters if this service ever runs on a
+Pi-class device.
+"""
+
 import os
+import time
+import hashlib
+import inspect
 import logging
 import asyncio
+import concurrent.futures
 from typing import Literal, Optional
-from fastapi import FastAPI, HTTPException
+
+from contextlib import asynccontextmanager, nullcontext
+from functools import lru_cache, partial
+
+import aiohttp
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from dotenv import load_dotenv
 import pyvizio
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from .env only when the shell hasn't already
+# exported them (containers get config from the orchestrator, so the file
+# stat + parse is pure waste there)
+if not os.getenv("VIZIO_IP"):
+    load_dotenv()
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the heavy singletons once per process and tear them down on exit"""
+    global tv_session
+
+    # The environment is final once the server is up; drop anything cached
+    # at import time (e.g. under the uvicorn reloader) and re-parse
+    _tv_env.cache_clear()
+
+    # Pooled, keep-alive session shared by every endpoint (TV API is
+    # HTTPS with a self-signed cert, hence ssl=False like pyvizio itself)
+    tv_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=20, ssl=False)
+    )
+
+    # Explicitly sized thread pool for the blocking fallback path; the
+    # asyncio default (min(32, cpus + 4)) can be as small as 5 workers on
+    # a small VM, serializing concurrent clients behind the TV's slow
+    # responses. Threads are cheap (~tens of KB each) for blocking I/O.
+    app.state.executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=int(os.getenv("TV_THREAD_POOL_SIZE", "16")),
+        thread_name_prefix="vizio",
+    )
+    asyncio.get_running_loop().set_default_executor(app.state.executor)
+
+    # The TV has a small, fixed HTTP backlog; flooding it from many clients
+    # causes timeouts and retries that cost more than queueing here would.
+    # Bound how many requests hit the device at once.
+    app.state.tv_sem = asyncio.Semaphore(int(os.getenv("TV_CONCURRENCY", "4")))
+
+    try:
+        app.state.tv = await get_tv_instance()
+        logger.info("TV API started successfully")
+    except Exception as e:
+        logger.error("Failed to initialize TV connection: %s", e)
+
+    yield
+
+    await tv_session.close()
+    app.state.executor.shutdown(wait=False)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Vizio TV API",
     description="API for controlling Vizio smart TVs using pyvizio",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson serializes these small dicts in C, roughly an order of
+    # magnitude faster than the stdlib encoder FastAPI defaults to
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -35,7 +103,15 @@ app.add_middleware(
 
 # Pydantic models
 class PowerRequest(BaseModel):
-    power: str = Field(..., description="Power state: 'on' or 'off'")
+    model_config = ConfigDict(frozen=True)
+
+    power: Literal["on", "off"] = Field(..., description="Power state: 'on' or 'off'")
+
+    @field_validator("power", mode="before")
+    @classmethod
+    def _lowercase_power(cls, v):
+        # Accept "ON"/"Off" etc. like the old handler-side check did
+        return v.lower() if isinstance(v, str) else v
 
 class VolumeRequest(BaseModel):
     volume: int = Field(..., ge=0, le=100, description="Volume level (0-100)")
@@ -51,201 +127,413 @@ class RemoteKeyRequest(BaseModel):
         ..., description="Remote key: UP, DOWN, LEFT, RIGHT, OK"
     )
 
+# Power mode values reported by the Vizio API
+_POWER_MODES = {0: "Off", 1: "On", 2: "Standby"}
+
 # Global TV instance
 tv_instance: Optional[pyvizio.Vizio] = None
 
-def get_tv_instance() -> pyvizio.Vizio:
+# Shared HTTP session for all TV calls. pyvizio is aiohttp-based under the
+# hood; without a session every call opens a fresh TCP+TLS connection to the
+# TV, so latency is dominated by handshakes. One pooled session reuses the
+# socket across all endpoints.
+tv_session: Optional[aiohttp.ClientSession] = None
+
+@lru_cache(maxsize=1)
+def _tv_env():
+    """Parse TV connection settings from the environment once.
+
+    os.getenv hits os.environ on every call; these values don't change
+    while the process is running, so parse them a single time.
+    """
+    return (
+        os.getenv("VIZIO_IP"),
+        int(os.getenv("VIZIO_PORT", "7345")),
+        os.getenv("VIZIO_AUTH_TOKEN") or "",
+    )
+
+# Guards first-time construction of the TV singleton so concurrent
+# startup-adjacent requests don't each build their own instance
+_tv_lock = asyncio.Lock()
+
+def _build_tv(ip, port, auth_token, device_type: str) -> pyvizio.Vizio:
+    """Construct a Vizio client bound to the shared session"""
+    tv = pyvizio.Vizio(
+        device_id=ip,  # Use IP as device_id
+        ip=f"{ip}:{port}",
+        name="Vizio TV",
+        auth_token=auth_token,
+        device_type=device_type,
+        timeout=10
+    )
+    # Reuse the shared session (if already created) instead of a
+    # per-call one so connections to the TV stay open
+    if tv_session is not None:
+        tv._session = tv_session
+    return tv
+
+async def _probe_and_build(ip, port, auth_token) -> pyvizio.Vizio:
+    """Build the TV client, probing once which device_type actually answers.
+
+    Constructing pyvizio.Vizio succeeds even for the wrong device type or
+    an unreachable host, so the old construct/except fallback never fired
+    and could cache the wrong type forever. Instead, try a short
+    get_power_state against each candidate (None means no answer —
+    pyvizio swallows transport errors) and keep the first that responds.
+    If nothing answers (TV unplugged), fall back to the 'tv' client so
+    requests start working once the device comes back.
+    """
+    fallback = None
+    for device_type in ("tv", "speaker"):
+        tv = _build_tv(ip, port, auth_token, device_type)
+        if fallback is None:
+            fallback = tv
+        try:
+            answered = await asyncio.wait_for(
+                run_sync_method(tv.get_power_state), timeout=2.0
+            )
+        except Exception as e:
+            logger.warning("Probe with device_type=%s failed: %s", device_type, e)
+            continue
+        if answered is not None:
+            logger.info("TV answered probe with device_type=%s", device_type)
+            return tv
+        logger.warning("No answer to probe with device_type=%s", device_type)
+    logger.warning("No device_type probe succeeded; defaulting to 'tv'")
+    return fallback
+
+async def get_tv_instance() -> pyvizio.Vizio:
     """Get or create TV instance with environment variables"""
     global tv_instance
 
-    if tv_instance is None:
-        ip = os.getenv("VIZIO_IP")
-        port = int(os.getenv("VIZIO_PORT", "7345"))
-        auth_token = os.getenv("VIZIO_AUTH_TOKEN")
+    # Fast path: already built, no lock needed
+    if tv_instance is not None:
+        return tv_instance
+
+    async with _tv_lock:
+        # Re-check under the lock; another request may have won the race
+        if tv_instance is not None:
+            return tv_instance
+
+        ip, port, auth_token = _tv_env()
 
         if not ip:
             raise HTTPException(status_code=500, detail="VIZIO_IP environment variable not set")
 
-        # Debug logging
-        logger.info(f"Initializing TV connection to {ip}:{port}")
-        logger.info(f"Auth token length: {len(auth_token) if auth_token else 0}")
-        logger.info(f"Auth token set: {bool(auth_token)}")
+        # Debug logging; the auth-token lines compute their arguments, so
+        # skip them entirely when INFO is suppressed
+        logger.info("Initializing TV connection to %s:%s", ip, port)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Auth token length: %s", len(auth_token))
+            logger.info("Auth token set: %s", bool(auth_token))
 
-        # Use correct pyvizio initialization parameters
-        try:
-            # device_id, ip, name, auth_token, device_type, timeout
-            tv_instance = pyvizio.Vizio(
-                device_id=ip,  # Use IP as device_id
-                ip=f"{ip}:{port}",
-                name="Vizio TV",
-                auth_token=auth_token or "",
-                device_type='tv',
-                timeout=10
-            )
-            logger.info("TV instance created successfully with correct parameters")
-        except Exception as e:
-            logger.warning(f"Failed with correct parameters: {e}")
-            # Fallback to speaker device type
-            tv_instance = pyvizio.Vizio(
-                device_id=ip,
-                ip=f"{ip}:{port}",
-                name="Vizio TV",
-                auth_token=auth_token or "",
-                device_type='speaker',
-                timeout=10
-            )
-            logger.info(f"TV instance created successfully with speaker device type")
+        # Probe once (normally during lifespan startup) so the chosen
+        # device_type is settled before the first real request
+        tv_instance = await _probe_and_build(ip, port, auth_token)
+        app.state.device_type = tv_instance.device_type
+        logger.info("TV instance created with device_type=%s", tv_instance.device_type)
 
     return tv_instance
 
-async def run_sync_method(method, *args, **kwargs):
-    """Run a sync method in a thread pool to avoid blocking"""
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, lambda: method(*args, **kwargs))
+# TTL cache for TV reads that dashboards poll aggressively. Lists change on
+# the minute scale and /tv/info state on the second scale, so a short TTL
+# turns N client polls into one TV round-trip. Per-key locks coalesce
+# concurrent misses (single-flight); failures are never cached.
+_tv_cache: dict = {}
+_tv_cache_locks: dict = {}
+
+INFO_TTL = 1.0
+INPUTS_TTL = 60.0
+APPS_TTL = 300.0
+READY_TTL = 5.0
+
+async def _collect_info(tv) -> list:
+    """Fetch the four /tv/info probes as one fused batch.
+
+    The probes still run concurrently on the shared session; fusing them
+    behind a single cache entry means one lookup, one lock, and one
+    in-flight batch per TTL window instead of four. Per-probe failures
+    come back as exception objects, never raised.
+    """
+    return await asyncio.gather(
+        run_sync_method(tv.get_power_state),
+        run_sync_method(tv.get_current_volume),
+        run_sync_method(tv.get_current_input),
+        run_sync_method(tv.is_muted),
+        return_exceptions=True,
+    )
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize TV connection on startup"""
+def _etag_json(request: Request, payload, max_age: int) -> Response:
+    """JSON response with a content-hash ETag.
+
+    Polling dashboards re-fetch these payloads constantly; with an ETag the
+    browser sends If-None-Match and a hit costs a bodyless 304 instead of
+    re-serializing and re-sending the full JSON.
+    """
+    # Returning a bare Response bypasses FastAPI's serialize_response, so
+    # run the payload through jsonable_encoder ourselves — pyvizio hands
+    # back plain objects (InputItem, AppConfig) orjson can't serialize
+    body = orjson.dumps(jsonable_encoder(payload))
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"Cache-Control": f"max-age={max_age}", "ETag": etag}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+async def _cached(key, ttl, fn):
+    """Return fn()'s result, cached under key for ttl seconds"""
+    entry = _tv_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+
+    lock = _tv_cache_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Whoever held the lock may have refreshed the entry already
+        entry = _tv_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        value = await fn()
+        _tv_cache[key] = (time.monotonic(), value)
+        return value
+
+def _cache_key(name):
+    """Cache key scoped to the configured TV so an IP change invalidates"""
+    return (name,) + _tv_env()
+
+def _async_counterpart(method):
+    """Find the VizioAsync coroutine behind a sync Vizio method, if any"""
+    if not (inspect.ismethod(method) and isinstance(method.__self__, pyvizio.VizioAsync)):
+        return None
+    candidate = getattr(pyvizio.VizioAsync, method.__name__, None)
+    if candidate is None or not asyncio.iscoroutinefunction(candidate):
+        return None
+    return candidate.__get__(method.__self__)
+
+# Identical reads currently in flight, keyed by (method name, args). Five
+# dashboards polling at the same instant should cost one TV round-trip,
+# not five parallel ones.
+_inflight: dict = {}
+
+async def run_sync_method(method, *args, executor=None, **kwargs):
+    """Run a TV call without blocking the event loop.
+
+    Concurrent identical *reads* (get_*/is_* with the same args) are
+    coalesced: the first caller issues the TV request and the rest await
+    its result. Writes are never deduplicated — two vol_up presses must
+    both reach the device.
+    """
+    name = getattr(method, "__name__", "")
+    is_read = (name.startswith("get_") or name.startswith("is_")) and not kwargs
+    if not is_read:
+        return await _invoke_tv(method, args, kwargs, executor)
+
+    key = (name, args)
+    existing = _inflight.get(key)
+    if existing is not None:
+        # Shield so one follower's cancellation can't cancel the shared
+        # future out from under the leader and the other followers
+        return await asyncio.shield(existing)
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
     try:
-        get_tv_instance()
-        logger.info("TV API started successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize TV connection: {e}")
-
-@app.get("/")
-async def root():
-    """Serve the frontend UI"""
-    return FileResponse("static/index.html")
+        result = await _invoke_tv(method, args, kwargs, executor)
+    except Exception as exc:
+        if not fut.done():
+            fut.set_exception(exc)
+            fut.exception()  # mark retrieved; followers still re-raise
+        raise
+    else:
+        if not fut.done():
+            fut.set_result(result)
+        return result
+    finally:
+        # The leader can also exit via BaseException — most importantly
+        # CancelledError when a caller like /ready wraps the probe in
+        # wait_for. Resolve the future unconditionally so followers fail
+        # fast instead of awaiting a dead key forever, and hand them a
+        # plain Exception: cancelling would fan CancelledError out past
+        # the handlers' except Exception blocks (and into cached
+        # /tv/info batches) instead of the normal error paths.
+        if not fut.done():
+            fut.set_exception(TimeoutError("coalesced TV call was cancelled"))
+            fut.exception()  # mark retrieved; followers still re-raise
+        del _inflight[key]
+
+async def _invoke_tv(method, args, kwargs, executor):
+    """Dispatch one TV call under the concurrency bound.
+
+    pyvizio's sync Vizio methods each spin up a private event loop and a
+    throwaway HTTP session via asyncio.run. Calling their VizioAsync
+    counterparts directly on our loop lets them share the persistent
+    session (and its pooled connections) instead. Anything without an
+    async counterpart falls back to the thread pool (executor=None picks
+    the app.state.executor installed at startup — see the module
+    docstring for why this must stay a *thread* pool).
+    """
+    # Bound in-flight TV calls (nullcontext before lifespan startup, e.g.
+    # in scripts importing this module directly)
+    limiter = getattr(app.state, "tv_sem", None) or nullcontext()
+    async with limiter:
+        async_method = _async_counterpart(method)
+        if async_method is not None:
+            return await async_method(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        # run_in_executor takes positional args natively; only kwargs need
+        # a partial, so skip the extra closure allocation in the common case
+        if kwargs:
+            return await loop.run_in_executor(executor, partial(method, *args, **kwargs))
+        return await loop.run_in_executor(executor, method, *args)
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
+    """Liveness probe: the process is up. No TV traffic, so orchestrators
+    can hit this at high rates without touching the device."""
+    return {"status": "ok"}
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: verify the TV actually answers, cached for READY_TTL"""
     try:
-        tv = get_tv_instance()
-        # Simple connection test
+        tv = await get_tv_instance()
+
+        async def probe():
+            state = await asyncio.wait_for(
+                run_sync_method(tv.get_power_state), timeout=1.0
+            )
+            # pyvizio swallows transport errors and reports None; that is
+            # "no answer", not readiness. Raising also keeps the failure
+            # out of the cache so the next probe retries.
+            if state is None:
+                raise RuntimeError("TV did not answer readiness probe")
+            return state
+
+        await _cached(_cache_key("ready"), READY_TTL, probe)
+        ip, port, auth_token = _tv_env()
         return {
-            "status": "healthy",
+            "status": "ready",
             "tv_connected": True,
-            "tv_ip": os.getenv("VIZIO_IP"),
-            "tv_port": os.getenv("VIZIO_PORT", "7345"),
-            "auth_token_set": bool(os.getenv("VIZIO_AUTH_TOKEN"))
+            "tv_ip": ip,
+            "tv_port": str(port),
+            "auth_token_set": bool(auth_token)
         }
+    except asyncio.TimeoutError as e:
+        # str(TimeoutError()) is empty; give the bare probe timeout a real
+        # message. Orchestrators decide on the status code alone, so
+        # failure must be a 503, not a 200 with an error body.
+        error = str(e) or "TV did not answer within 1s"
+        logger.error("Readiness check failed: %s", error)
+        return ORJSONResponse(
+            {"status": "not_ready", "tv_connected": False, "error": error},
+            status_code=503,
+        )
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return {
-            "status": "unhealthy",
-            "tv_connected": False,
-            "error": str(e)
-        }
+        logger.error("Readiness check failed: %s", e)
+        return ORJSONResponse(
+            {"status": "not_ready", "tv_connected": False, "error": str(e)},
+            status_code=503,
+        )
 
 @app.get("/tv/info")
-async def get_tv_info():
+async def get_tv_info(request: Request):
     """Get comprehensive TV information with interpreted power state"""
     try:
-        tv = get_tv_instance()
+        tv = await get_tv_instance()
 
         # Base info
+        ip, port, auth_token = _tv_env()
         info = {
-            "ip": os.getenv("VIZIO_IP"),
-            "port": os.getenv("VIZIO_PORT", "7345"),
-            "auth_token_set": bool(os.getenv("VIZIO_AUTH_TOKEN"))
+            "ip": ip,
+            "port": str(port),
+            "auth_token_set": bool(auth_token)
         }
 
-        # Get power state and interpret it
-        try:
-            power_mode_raw = await run_sync_method(tv.get_power_state)
-
-            # Interpret power mode values based on Vizio API
-            if power_mode_raw == 0:
-                power_status = "Off"
-            elif power_mode_raw == 1:
-                power_status = "On"
-            elif power_mode_raw == 2:
-                power_status = "Standby"
-            else:
-                power_status = "Unknown"
-
-            info["power"] = power_status
-            info["power_mode"] = power_mode_raw
+        # One fused batch per TTL window: a single cache entry and lock
+        # instead of four, so a poll costs one lookup on the hot path.
+        # The short TTL absorbs dashboard polling bursts.
+        power_mode_raw, volume, current_input, muted = await _cached(
+            _cache_key("info"), INFO_TTL, lambda: _collect_info(tv)
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to get power state: {e}")
+        # Power state, interpreted based on Vizio API values
+        if isinstance(power_mode_raw, Exception):
+            logger.error("Failed to get power state: %s", power_mode_raw)
             info["power"] = "Unknown"
             info["power_mode"] = None
-            info["power_error"] = str(e)
+            info["power_error"] = str(power_mode_raw)
+        else:
+            info["power"] = _POWER_MODES.get(power_mode_raw, "Unknown")
+            info["power_mode"] = power_mode_raw
 
-        # Get volume
-        try:
-            volume = await run_sync_method(tv.get_current_volume)
-            info["volume"] = volume if volume is not None else 0
-        except Exception as e:
-            logger.error(f"Failed to get volume: {e}")
+        # Volume
+        if isinstance(volume, Exception):
+            logger.error("Failed to get volume: %s", volume)
             info["volume"] = 0
-            info["volume_error"] = str(e)
+            info["volume_error"] = str(volume)
+        else:
+            info["volume"] = volume if volume is not None else 0
 
-        # Get current input
-        try:
-            current_input = await run_sync_method(tv.get_current_input)
-            info["input"] = current_input if current_input else "Unknown"
-        except Exception as e:
-            logger.error(f"Failed to get input: {e}")
+        # Current input
+        if isinstance(current_input, Exception):
+            logger.error("Failed to get input: %s", current_input)
             info["input"] = "Unknown"
-            info["input_error"] = str(e)
+            info["input_error"] = str(current_input)
+        else:
+            info["input"] = current_input if current_input else "Unknown"
 
-        # Get mute status
-        try:
-            muted = await run_sync_method(tv.is_muted)
-            info["muted"] = bool(muted) if muted is not None else False
-        except Exception as e:
-            logger.error(f"Failed to get mute state: {e}")
+        # Mute status
+        if isinstance(muted, Exception):
+            logger.error("Failed to get mute state: %s", muted)
             info["muted"] = False
-            info["mute_error"] = str(e)
+            info["mute_error"] = str(muted)
+        else:
+            info["muted"] = bool(muted) if muted is not None else False
 
-        return info
+        return _etag_json(request, info, max_age=1)
 
     except Exception as e:
-        logger.error(f"Failed to get TV info: {e}")
+        logger.error("Failed to get TV info: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/tv/power")
 async def set_power(request: PowerRequest):
     """Set TV power state"""
     try:
-        tv = get_tv_instance()
-        logger.info(f"Attempting to set power to: {request.power}")
-
-        power = request.power.lower()
-        if power not in ("on", "off"):
-            raise HTTPException(status_code=400, detail="Power must be 'on' or 'off'")
+        tv = await get_tv_instance()
+        logger.info("Attempting to set power to: %s", request.power)
 
+        # Pydantic has already normalized and validated the value
+        power = request.power
         if power == "on":
             logger.info("Calling tv.pow_on()")
             result = await run_sync_method(tv.pow_on)
-            logger.info(f"pow_on result: {result}")
+            logger.info("pow_on result: %s", result)
             message = "TV powered on"
         else:
             logger.info("Calling tv.pow_off()")
             result = await run_sync_method(tv.pow_off)
-            logger.info(f"pow_off result: {result}")
+            logger.info("pow_off result: %s", result)
             message = "TV powered off"
 
-        logger.info(f"Power operation completed: {message}")
+        logger.info("Power operation completed: %s", message)
         return {"message": message, "power": power}
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to set power: {e}")
+        logger.error("Failed to set power: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/tv/power")
 async def get_power():
     """Get current power state"""
     try:
-        tv = get_tv_instance()
+        tv = await get_tv_instance()
         power_state = await run_sync_method(tv.get_power_state)
         return {"power": power_state}
     except Exception as e:
-        logger.error(f"Failed to get power state: {e}")
+        logger.error("Failed to get power state: %s", e)
         # Return a more user-friendly error
         if "Empty auth token" in str(e):
             return {
@@ -258,107 +546,120 @@ async def get_power():
 async def set_volume(request: VolumeRequest):
     """Set TV volume"""
     try:
-        tv = get_tv_instance()
-        # Clamp requested volume to device-supported range
-        max_volume = await run_sync_method(tv.get_max_volume)
-        target_volume = max(0, min(request.volume, max_volume))
-
-        # First, try the direct audio setting API
+        tv = await get_tv_instance()
+        # Clamp requested volume to device-supported range (the 0..100
+        # bound is already enforced by the Pydantic model). Max volume is
+        # fixed per device model, so fetch it once and keep it on app.state.
+        max_volume = getattr(app.state, "max_volume", None)
+        if max_volume is None:
+            # get_max_volume is a local per-device-type table lookup in
+            # pyvizio, not a TV round-trip — call it inline rather than
+            # paying a thread-pool hop for a dict access
+            max_volume = tv.get_max_volume()
+            app.state.max_volume = max_volume
+        target_volume = min(request.volume, max_volume)
+
+        # First, try the direct audio setting API; when the TV confirms
+        # success there is nothing to verify, so skip the extra round-trip
         set_ok = await run_sync_method(tv.set_audio_setting, "volume", target_volume)
-
-        # If direct set fails, fall back to step-wise adjustment
-        if not set_ok:
-            current_volume = await run_sync_method(tv.get_current_volume)
-            if current_volume is None:
-                raise HTTPException(status_code=500, detail="Could not get current volume")
-
-            diff = target_volume - current_volume
-            if diff > 0:
-                await run_sync_method(tv.vol_up, diff)
-            elif diff < 0:
-                await run_sync_method(tv.vol_down, abs(diff))
-
-        # Verify resulting volume
+        if set_ok:
+            return {"message": f"Volume set to {target_volume}", "volume": target_volume}
+
+        # Direct set failed: fall back to step-wise adjustment, which
+        # genuinely needs the current volume to compute the step count
+        current_volume = await run_sync_method(tv.get_current_volume)
+        if current_volume is None:
+            raise HTTPException(status_code=500, detail="Could not get current volume")
+
+        diff = target_volume - current_volume
+        if diff > 0:
+            await run_sync_method(tv.vol_up, diff)
+        elif diff < 0:
+            await run_sync_method(tv.vol_down, abs(diff))
+
+        # Verify resulting volume (only on the fallback path)
         new_volume = await run_sync_method(tv.get_current_volume)
         if new_volume is None:
             raise HTTPException(status_code=500, detail="Failed to verify new volume")
 
         return {"message": f"Volume set to {new_volume}", "volume": new_volume}
     except Exception as e:
-        logger.error(f"Failed to set volume: {e}")
+        logger.error("Failed to set volume: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/tv/volume")
 async def get_volume():
     """Get current volume"""
     try:
-        tv = get_tv_instance()
+        tv = await get_tv_instance()
         volume = await run_sync_method(tv.get_current_volume)
         return {"volume": volume}
     except Exception as e:
-        logger.error(f"Failed to get volume: {e}")
+        logger.error("Failed to get volume: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/tv/input")
 async def set_input(request: InputRequest):
     """Set TV input"""
     try:
-        tv = get_tv_instance()
+        tv = await get_tv_instance()
         await run_sync_method(tv.set_input, request.input_name)
         return {"message": f"Input set to {request.input_name}", "input": request.input_name}
     except Exception as e:
-        logger.error(f"Failed to set input: {e}")
+        logger.error("Failed to set input: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/tv/input")
 async def get_input():
     """Get current input"""
     try:
-        tv = get_tv_instance()
+        tv = await get_tv_instance()
         current_input = await run_sync_method(tv.get_current_input)
         return {"input": current_input}
     except Exception as e:
-        logger.error(f"Failed to get input: {e}")
+        logger.error("Failed to get input: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/tv/inputs")
-async def get_available_inputs():
+async def get_available_inputs(request: Request):
     """Get available inputs"""
     try:
-        tv = get_tv_instance()
-        inputs = await run_sync_method(tv.get_inputs_list)
-        return {"inputs": inputs}
+        tv = await get_tv_instance()
+        inputs = await _cached(_cache_key("inputs"), INPUTS_TTL,
+                               lambda: run_sync_method(tv.get_inputs_list))
+        return _etag_json(request, {"inputs": inputs}, max_age=30)
     except Exception as e:
-        logger.error(f"Failed to get inputs: {e}")
+        logger.error("Failed to get inputs: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/tv/app")
 async def launch_app(request: AppRequest):
     """Launch an app on the TV"""
     try:
-        tv = get_tv_instance()
+        tv = await get_tv_instance()
         await run_sync_method(tv.launch_app, request.app_name)
         return {"message": f"App {request.app_name} launched", "app": request.app_name}
     except Exception as e:
-        logger.error(f"Failed to launch app: {e}")
+        logger.error("Failed to launch app: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/tv/apps")
-async def get_available_apps():
+async def get_available_apps(request: Request):
     """Get available apps"""
     try:
-        tv = get_tv_instance()
-        apps = await run_sync_method(tv.get_apps_list)
-        return {"apps": apps}
+        tv = await get_tv_instance()
+        apps = await _cached(_cache_key("apps"), APPS_TTL,
+                             lambda: run_sync_method(tv.get_apps_list))
+        return _etag_json(request, {"apps": apps}, max_age=30)
     except Exception as e:
-        logger.error(f"Failed to get apps: {e}")
+        logger.error("Failed to get apps: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/tv/mute")
 async def set_mute(muted: bool = True):
     """Set mute state"""
     try:
-        tv = get_tv_instance()
+        tv = await get_tv_instance()
         if muted:
             await run_sync_method(tv.mute_on)
             message = "TV muted"
@@ -367,33 +668,35 @@ async def set_mute(muted: bool = True):
             message = "TV unmuted"
         return {"message": message, "muted": muted}
     except Exception as e:
-        logger.error(f"Failed to set mute: {e}")
+        logger.error("Failed to set mute: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/tv/mute")
 async def get_mute():
     """Get current mute state"""
     try:
-        tv = get_tv_instance()
+        tv = await get_tv_instance()
         muted = await run_sync_method(tv.is_muted)
         return {"muted": muted}
     except Exception as e:
-        logger.error(f"Failed to get mute state: {e}")
+        logger.error("Failed to get mute state: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/tv/remote")
 async def send_remote_key(request: RemoteKeyRequest):
     """Send a remote key press (UP, DOWN, LEFT, RIGHT, OK)"""
     try:
-        tv = get_tv_instance()
+        tv = await get_tv_instance()
         await run_sync_method(tv.remote, request.key)
         return {"message": f"Key '{request.key}' sent", "key": request.key}
     except Exception as e:
-        logger.error(f"Failed to send remote key: {e}")
+        logger.error("Failed to send remote key: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-# Mount static files AFTER all API routes so they don't shadow them
-app.mount("/", StaticFiles(directory="static"), name="static")
+# Mount static files AFTER all API routes so they don't shadow them.
+# html=True makes StaticFiles resolve "/" to index.html itself (with
+# ETag/Last-Modified 304 support), so no Python route handler is needed
+app.mount("/", StaticFiles(directory="static", html=True), name="static")
 
 if __name__ == "__main__":
     import uvicorn